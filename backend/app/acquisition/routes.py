@@ -42,11 +42,17 @@ api_router = APIRouter(dependencies=[CurrentActiveUserDep])
 
 
 @api_router.get("/acquisitions", response_model=AcquisitionList)
-def get_acquisitions(session: SessionDep, skip: int = 0, limit: int = 100):
+def get_acquisitions(
+    session: SessionDep, skip: int = 0, limit: int = 100, name: str | None = None
+):
     count_statement = select(func.count()).select_from(Acquisition)
+    if name is not None:
+        count_statement = count_statement.where(Acquisition.name == name)
     count = session.exec(count_statement).one()
 
     statement = select(Acquisition).offset(skip).limit(limit)
+    if name is not None:
+        statement = statement.where(Acquisition.name == name)
     users = session.exec(statement).all()
 
     return AcquisitionList(data=users, count=count)
@@ -267,11 +273,15 @@ def create_instrument_type(
 
 @api_router.get("/instrument_types", response_model=InstrumentTypeList)
 def get_instrument_types(
-    session: SessionDep, skip: int = 0, limit: int = 100
+    session: SessionDep, skip: int = 0, limit: int = 100, name: str | None = None
 ) -> InstrumentTypeList:
     count_statement = select(func.count()).select_from(InstrumentType)
+    if name is not None:
+        count_statement = count_statement.where(InstrumentType.name == name)
     count = session.exec(count_statement).one()
     statement = select(InstrumentType).offset(skip).limit(limit)
+    if name is not None:
+        statement = statement.where(InstrumentType.name == name)
     instrument_types = session.exec(statement).all()
     return InstrumentTypeList(data=instrument_types, count=count)
 
@@ -302,11 +312,15 @@ def create_instrument(
 
 @api_router.get("/instruments", response_model=InstrumentList)
 def get_instruments(
-    session: SessionDep, skip: int = 0, limit: int = 100
+    session: SessionDep, skip: int = 0, limit: int = 100, name: str | None = None
 ) -> InstrumentList:
     count_statement = select(func.count()).select_from(Instrument)
+    if name is not None:
+        count_statement = count_statement.where(Instrument.name == name)
     count = session.exec(count_statement).one()
     statement = select(Instrument).offset(skip).limit(limit)
+    if name is not None:
+        statement = statement.where(Instrument.name == name)
     instruments = session.exec(statement).all()
     return InstrumentList(data=instruments, count=count)
 
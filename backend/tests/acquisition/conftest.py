@@ -3,15 +3,53 @@ from collections.abc import Generator
 from pathlib import Path
 
 import pytest
-from prefect.testing.utilities import prefect_test_harness
+from sqlalchemy import Connection
+from sqlmodel import Session
 
+from app.acquisition.flows.acquisition_planning import implement_plan
+from app.acquisition.models import Acquisition, AcquisitionPlan, Instrument
 from app.core.config import settings
+from app.labware.models import Wellplate
+from tests.acquisition.utils import (
+    create_random_acquisition,
+    create_random_acquisition_plan,
+    get_shared_instrument,
+)
+from tests.labware.utils import create_random_wellplate
 
 
-@pytest.fixture(autouse=True, scope="module")
-def prefect_test_fixture():
-    with prefect_test_harness():
-        yield
+@pytest.fixture(scope="session", autouse=True)
+def shared_instrument(connection: Connection) -> Instrument:
+    """
+    Insert the factories' default instrument once, in the session's outer
+    transaction, before any module or test savepoint opens. Otherwise the
+    first factory call would insert it inside a savepoint that rolls it back.
+    """
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+        return get_shared_instrument(session=session)
+
+
+@pytest.fixture(scope="module")
+def shared_acquisition(db_module: Session) -> Acquisition:
+    """
+    Acquisition shared by the tests of a module that only need a valid
+    reference to one. Tests that modify or delete it must use the factory.
+    """
+    return create_random_acquisition(session=db_module)
+
+
+@pytest.fixture(scope="module")
+def shared_wellplate(db_module: Session) -> Wellplate:
+    return create_random_wellplate(session=db_module)
+
+
+@pytest.fixture
+def scheduled_plan(db: Session) -> AcquisitionPlan:
+    """
+    Acquisition plan with its plate-reads implemented.
+    """
+    plan = create_random_acquisition_plan(session=db)
+    return implement_plan(session=db, plan=plan)
 
 
 @pytest.fixture(scope="session", autouse=True)
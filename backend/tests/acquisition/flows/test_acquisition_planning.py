@@ -1,22 +1,23 @@
 from datetime import timedelta
-from unittest.mock import patch
 
 import pytest
 from sqlmodel import Session
 
 from app.acquisition import crud
+from app.acquisition.flows import acquisition_planning
 from app.acquisition.flows.acquisition_planning import (
     check_to_schedule_acquisition_plan,
     implement_plan,
     schedule_unscheduled_reads,
 )
 from app.acquisition.models import PlatereadSpecUpdate, ProcessStatus
-from app.labware import crud as labware_crud
-from app.labware.models import Location, WellplateUpdate
+from app.labware.models import Location
 from tests.acquisition.utils import (
     complete_reads,
     create_random_acquisition_plan,
 )
+from tests.labware.utils import set_wellplate_location
+from tests.utils import record_calls
 
 
 def test_update_plateread(db: Session) -> None:
@@ -46,58 +47,50 @@ def test_implement_plan(db: Session) -> None:
     assert t0.start_after + timedelta(minutes=2) == t1.start_after
 
 
-def test_schedule_reads(db: Session) -> None:
+def test_schedule_reads(db: Session, monkeypatch: pytest.MonkeyPatch) -> None:
     plan = create_random_acquisition_plan(
         session=db, storage_location=Location.CYTOMAT2, n_reads=2
     )
     implement_plan(session=db, plan=plan)
-    with patch(
-        "app.acquisition.flows.acquisition_planning.submit_plateread_spec"
-    ) as mock_submit_plateread_spec:
-        schedule_unscheduled_reads(session=db, plan=plan)
-        assert mock_submit_plateread_spec.call_count == 2
+    submitted = record_calls(monkeypatch, acquisition_planning, "submit_plateread_spec")
+    schedule_unscheduled_reads(session=db, plan=plan)
+    assert len(submitted) == 2
 
 
-def test_schedule_reads_already_implemented(db: Session) -> None:
+def test_schedule_reads_already_implemented(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """already implemented plans are not re-implemented, but they are scheduled"""
     plan = create_random_acquisition_plan(
         session=db, storage_location=Location.CYTOMAT2, n_reads=1
     )
     implement_plan(session=db, plan=plan)
-    with (
-        patch(
-            "app.acquisition.flows.acquisition_planning.submit_plateread_spec"
-        ) as mock_submit_plateread_spec,
-        patch(
-            "app.acquisition.flows.acquisition_planning.implement_plan"
-        ) as mock_implement_plan,
-    ):
-        schedule_unscheduled_reads(session=db, plan=plan)
-        mock_submit_plateread_spec.assert_called_once()
-        mock_implement_plan.assert_not_called()
-
-
-def test_schedule_reads_already_completed(db: Session) -> None:
+    submitted = record_calls(monkeypatch, acquisition_planning, "submit_plateread_spec")
+    implemented = record_calls(monkeypatch, acquisition_planning, "implement_plan")
+    schedule_unscheduled_reads(session=db, plan=plan)
+    assert len(submitted) == 1
+    assert implemented == []
+
+
+def test_schedule_reads_already_completed(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """already completed plans are not re-implemented or scheduled"""
     plan = create_random_acquisition_plan(
         session=db, storage_location=Location.CYTOMAT2, n_reads=1
     )
     implement_plan(session=db, plan=plan)
     complete_reads(session=db, acquisition_plan=plan)
-    with (
-        patch(
-            "app.acquisition.flows.acquisition_planning.submit_plateread_spec"
-        ) as mock_submit_plateread_spec,
-        patch(
-            "app.acquisition.flows.acquisition_planning.implement_plan"
-        ) as mock_implement_plan,
-    ):
-        schedule_unscheduled_reads(session=db, plan=plan)
-        mock_submit_plateread_spec.assert_not_called()
-        mock_implement_plan.assert_not_called()
-
-
-def test_schedule_reads_not_pending(db: Session) -> None:
+    submitted = record_calls(monkeypatch, acquisition_planning, "submit_plateread_spec")
+    implemented = record_calls(monkeypatch, acquisition_planning, "implement_plan")
+    schedule_unscheduled_reads(session=db, plan=plan)
+    assert submitted == []
+    assert implemented == []
+
+
+def test_schedule_reads_not_pending(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Reads that are not pending are not scheduled"""
     plan = create_random_acquisition_plan(
         session=db, storage_location=Location.CYTOMAT2, n_reads=2
@@ -108,14 +101,12 @@ def test_schedule_reads_not_pending(db: Session) -> None:
     plateread_in = PlatereadSpecUpdate(status=ProcessStatus.SCHEDULED)
     crud.update_plateread(session=db, db_plateread=plateread, plateread_in=plateread_in)
 
-    with patch(
-        "app.acquisition.flows.acquisition_planning.submit_plateread_spec"
-    ) as mock_submit_plateread_spec:
-        schedule_unscheduled_reads(session=db, plan=plan)
-        assert mock_submit_plateread_spec.call_count == 1
+    submitted = record_calls(monkeypatch, acquisition_planning, "submit_plateread_spec")
+    schedule_unscheduled_reads(session=db, plan=plan)
+    assert len(submitted) == 1
 
 
-def test_check_to_implement_plans(db: Session) -> None:
+def test_check_to_implement_plans(db: Session, monkeypatch: pytest.MonkeyPatch) -> None:
     acquisition_plan = create_random_acquisition_plan(
         session=db, storage_location=Location.CYTOMAT2, n_reads=2
     )
@@ -123,22 +114,19 @@ def test_check_to_implement_plans(db: Session) -> None:
 
     wellplate = acquisition_plan.wellplate
     assert wellplate.location == Location.EXTERNAL
-    wellplate_in = WellplateUpdate(location=Location.CYTOMAT2)
-    labware_crud.update_wellplate(
-        session=db, db_wellplate=wellplate, wellplate_in=wellplate_in
-    )
+    set_wellplate_location(session=db, wellplate=wellplate, location=Location.CYTOMAT2)
 
-    with patch(
-        "app.acquisition.flows.acquisition_planning.submit_plateread_spec"
-    ) as mock_submit_plateread_spec:
-        check_to_schedule_acquisition_plan(wellplate_id=wellplate.id)  # type: ignore[arg-type]
-        assert mock_submit_plateread_spec.call_count == 2
+    submitted = record_calls(monkeypatch, acquisition_planning, "submit_plateread_spec")
+    check_to_schedule_acquisition_plan(wellplate_id=wellplate.id)  # type: ignore[arg-type]
+    assert len(submitted) == 2
 
     db.refresh(acquisition_plan)
     assert acquisition_plan.reads != []
 
 
-def test_check_to_implement_plans_already_implemented(db: Session) -> None:
+def test_check_to_implement_plans_already_implemented(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
     acquisition_plan = create_random_acquisition_plan(
         session=db, storage_location=Location.CYTOMAT2, n_reads=2
     )
@@ -146,24 +134,21 @@ def test_check_to_implement_plans_already_implemented(db: Session) -> None:
 
     wellplate = acquisition_plan.wellplate
     assert wellplate.location == Location.EXTERNAL
-    wellplate_in = WellplateUpdate(location=Location.CYTOMAT2)
-    labware_crud.update_wellplate(
-        session=db, db_wellplate=wellplate, wellplate_in=wellplate_in
-    )
+    set_wellplate_location(session=db, wellplate=wellplate, location=Location.CYTOMAT2)
 
     check_to_schedule_acquisition_plan(wellplate_id=wellplate.id)  # type: ignore[arg-type]
     db.refresh(acquisition_plan)
     assert acquisition_plan.reads != []
 
-    with patch(
-        "app.acquisition.flows.acquisition_planning.submit_plateread_spec"
-    ) as mock_submit_plateread_spec:
-        check_to_schedule_acquisition_plan(wellplate_id=wellplate.id)  # type: ignore[arg-type]
-        # won't resubmit scheduled reads
-        mock_submit_plateread_spec.assert_not_called()
+    submitted = record_calls(monkeypatch, acquisition_planning, "submit_plateread_spec")
+    check_to_schedule_acquisition_plan(wellplate_id=wellplate.id)  # type: ignore[arg-type]
+    # won't resubmit scheduled reads
+    assert submitted == []
 
 
-def test_check_to_implement_plans_different_storage_location(db: Session) -> None:
+def test_check_to_implement_plans_different_storage_location(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
     acquisition_plan = create_random_acquisition_plan(
         session=db, storage_location=Location.HOTEL
     )
@@ -171,16 +156,11 @@ def test_check_to_implement_plans_different_storage_location(db: Session) -> Non
 
     wellplate = acquisition_plan.wellplate
     assert wellplate.location == Location.EXTERNAL
-    wellplate_in = WellplateUpdate(location=Location.CYTOMAT2)
-    labware_crud.update_wellplate(
-        session=db, db_wellplate=wellplate, wellplate_in=wellplate_in
-    )
+    set_wellplate_location(session=db, wellplate=wellplate, location=Location.CYTOMAT2)
 
-    with patch(
-        "app.acquisition.flows.acquisition_planning.submit_plateread_spec"
-    ) as mock_submit_plateread_spec:
-        check_to_schedule_acquisition_plan(wellplate_id=wellplate.id)  # type: ignore[arg-type]
-        mock_submit_plateread_spec.assert_not_called()
+    submitted = record_calls(monkeypatch, acquisition_planning, "submit_plateread_spec")
+    check_to_schedule_acquisition_plan(wellplate_id=wellplate.id)  # type: ignore[arg-type]
+    assert submitted == []
 
     db.refresh(acquisition_plan)
     # plate is not present in acquisition plan's storage_location, so scheduling
@@ -1,10 +1,12 @@
 import random
-from unittest.mock import patch
+from unittest.mock import call, patch
 
+import pytest
 from globus_compute_sdk import ShellResult
 from sqlmodel import Session
 
 from app.acquisition import crud
+from app.acquisition.flows import analysis
 from app.acquisition.flows.acquisition_planning import (
     check_to_schedule_acquisition_plan,
 )
@@ -29,6 +31,7 @@ from tests.acquisition.utils import (
     create_random_artifact_collection,
     move_plate_to_acquisition_plan_location,
 )
+from tests.utils import record_calls
 
 
 def _mock_batch_job_submission(mock_executor_constructor):
@@ -52,23 +55,23 @@ def _assert_batch_job_submission_not_called(mock_executor_constructor):
     mock_executor_constructor.return_value.__enter__.return_value.submit.assert_not_called()
 
 
-def test_handle_analyses_when_no_acquisition_plan(db: Session):
+def test_handle_analyses_when_no_acquisition_plan(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+):
     """Only calls immediate analyses"""
     acquisition = create_random_acquisition(session=db)
-    with (
-        patch(
-            "app.acquisition.flows.analysis.handle_immediate_analyses"
-        ) as mock_immediate,
-        patch("app.acquisition.flows.analysis.handle_post_read_analyses") as mock_pr,
-        patch("app.acquisition.flows.analysis.handle_end_of_run_analyses") as mock_eor,
-    ):
-        handle_analyses(acquisition=acquisition, session=db)
-        mock_immediate.assert_called_once_with(acquisition, db)
-        mock_pr.assert_not_called()
-        mock_eor.assert_not_called()
-
-
-def test_handle_analyses_with_unstarted_acquisition(db: Session):
+    immediate = record_calls(monkeypatch, analysis, "handle_immediate_analyses")
+    post_read = record_calls(monkeypatch, analysis, "handle_post_read_analyses")
+    end_of_run = record_calls(monkeypatch, analysis, "handle_end_of_run_analyses")
+    handle_analyses(acquisition=acquisition, session=db)
+    assert immediate == [call(acquisition, db)]
+    assert post_read == []
+    assert end_of_run == []
+
+
+def test_handle_analyses_with_unstarted_acquisition(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+):
     """Calls post_read and immediate analyses"""
     acquisition = create_random_acquisition(session=db)
     acquisition_plan = create_random_acquisition_plan(
@@ -79,20 +82,18 @@ def test_handle_analyses_with_unstarted_acquisition(db: Session):
     )
     check_to_schedule_acquisition_plan(wellplate_id=acquisition_plan.wellplate_id)
     # There is now an acquisition plan that has not been started
-    with (
-        patch(
-            "app.acquisition.flows.analysis.handle_immediate_analyses"
-        ) as mock_immediate,
-        patch("app.acquisition.flows.analysis.handle_post_read_analyses") as mock_pr,
-        patch("app.acquisition.flows.analysis.handle_end_of_run_analyses") as mock_eor,
-    ):
-        handle_analyses(acquisition=acquisition, session=db)
-        mock_immediate.assert_called_once_with(acquisition, db)
-        mock_pr.assert_not_called()
-        mock_eor.assert_not_called()
-
-
-def test_handle_analyses_with_one_completed_read(db: Session):
+    immediate = record_calls(monkeypatch, analysis, "handle_immediate_analyses")
+    post_read = record_calls(monkeypatch, analysis, "handle_post_read_analyses")
+    end_of_run = record_calls(monkeypatch, analysis, "handle_end_of_run_analyses")
+    handle_analyses(acquisition=acquisition, session=db)
+    assert immediate == [call(acquisition, db)]
+    assert post_read == []
+    assert end_of_run == []
+
+
+def test_handle_analyses_with_one_completed_read(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+):
     """Calls post_read and immediate analyses when one read is completed"""
     acquisition = create_random_acquisition(session=db)
     acquisition_plan = create_random_acquisition_plan(
@@ -103,22 +104,18 @@ def test_handle_analyses_with_one_completed_read(db: Session):
     )
     check_to_schedule_acquisition_plan(wellplate_id=acquisition_plan.wellplate_id)
     complete_reads(acquisition_plan, db, n_reads=1)  # Complete one read
-    with (
-        patch(
-            "app.acquisition.flows.analysis.handle_immediate_analyses"
-        ) as mock_immediate,
-        patch("app.acquisition.flows.analysis.handle_post_read_analyses") as mock_pr,
-        patch("app.acquisition.flows.analysis.handle_end_of_run_analyses") as mock_eor,
-    ):
-        handle_analyses(acquisition=acquisition, session=db)
-        mock_immediate.assert_called_once_with(acquisition, db)
-        mock_pr.assert_called_once_with(
-            1, acquisition, db
-        )  # Expect post_read to be called
-        mock_eor.assert_not_called()
-
-
-def test_handle_analyses_with_complete_acquisition(db: Session):
+    immediate = record_calls(monkeypatch, analysis, "handle_immediate_analyses")
+    post_read = record_calls(monkeypatch, analysis, "handle_post_read_analyses")
+    end_of_run = record_calls(monkeypatch, analysis, "handle_end_of_run_analyses")
+    handle_analyses(acquisition=acquisition, session=db)
+    assert immediate == [call(acquisition, db)]
+    assert post_read == [call(1, acquisition, db)]
+    assert end_of_run == []
+
+
+def test_handle_analyses_with_complete_acquisition(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+):
     """Calls immediate, post_read, and end_of_run analyses"""
     acquisition = create_random_acquisition(session=db)
     acquisition_plan = create_random_acquisition_plan(
@@ -130,21 +127,13 @@ def test_handle_analyses_with_complete_acquisition(db: Session):
 
     check_to_schedule_acquisition_plan(wellplate_id=acquisition_plan.wellplate_id)
     complete_reads(acquisition_plan, db)
-    with (
-        patch(
-            "app.acquisition.flows.analysis.handle_post_read_analyses"
-        ) as mock_post_read,
-        patch(
-            "app.acquisition.flows.analysis.handle_end_of_run_analyses"
-        ) as mock_end_of_run,
-        patch(
-            "app.acquisition.flows.analysis.handle_immediate_analyses"
-        ) as mock_immediate,
-    ):
-        handle_analyses(acquisition=acquisition, session=db)
-        mock_post_read.assert_called_once_with(1, acquisition, db)
-        mock_end_of_run.assert_called_once_with(acquisition, db)
-        mock_immediate.assert_called_once_with(acquisition, db)
+    immediate = record_calls(monkeypatch, analysis, "handle_immediate_analyses")
+    post_read = record_calls(monkeypatch, analysis, "handle_post_read_analyses")
+    end_of_run = record_calls(monkeypatch, analysis, "handle_end_of_run_analyses")
+    handle_analyses(acquisition=acquisition, session=db)
+    assert immediate == [call(acquisition, db)]
+    assert post_read == [call(1, acquisition, db)]
+    assert end_of_run == [call(acquisition, db)]
 
 
 def test_handle_post_read_analyses(db: Session):
@@ -14,6 +14,7 @@ from app.acquisition.models import ArtifactType, Repository
 from tests.acquisition.utils import create_random_artifact_collection
 
 
+@pytest.mark.slow
 def test_copy_acquisition_to_analysis(db: Session):
     collection = create_random_artifact_collection(
         location=Repository.ACQUISITION_STORE, session=db
@@ -25,6 +26,7 @@ def test_copy_acquisition_to_analysis(db: Session):
     assert new_collection.path.exists()
 
 
+@pytest.mark.slow
 def test_copy_analysis_to_acquisition(db: Session):
     collection = create_random_artifact_collection(
         location=Repository.ANALYSIS_STORE, session=db
@@ -36,6 +38,7 @@ def test_copy_analysis_to_acquisition(db: Session):
     assert new_collection.path.exists()
 
 
+@pytest.mark.slow
 def test_copy_acquisition_to_archive(db: Session):
     collection = create_random_artifact_collection(
         location=Repository.ACQUISITION_STORE, session=db
@@ -47,6 +50,7 @@ def test_copy_acquisition_to_archive(db: Session):
     assert new_collection.path.exists()
 
 
+@pytest.mark.slow
 def test_copy_archive_to_acquisition(db: Session):
     collection = create_random_artifact_collection(
         location=Repository.ANALYSIS_STORE, session=db
@@ -62,6 +66,7 @@ def test_copy_archive_to_acquisition(db: Session):
     assert new_collection.path.exists()
 
 
+@pytest.mark.slow
 def test_copy_analysis_to_archive(db: Session):
     collection = create_random_artifact_collection(
         location=Repository.ANALYSIS_STORE, session=db
@@ -73,6 +78,7 @@ def test_copy_analysis_to_archive(db: Session):
     assert new_collection.path.exists()
 
 
+@pytest.mark.slow
 def test_copy_archive_to_analysis(db: Session):
     collection = create_random_artifact_collection(
         location=Repository.ACQUISITION_STORE, session=db
@@ -119,6 +125,7 @@ def test_copy_collection_transfer_fails(db: Session):
         )
 
 
+@pytest.mark.slow
 def test_move_collection(db: Session):
     orig_collection = create_random_artifact_collection(
         location=Repository.ACQUISITION_STORE, session=db
@@ -9,6 +9,7 @@ from app.acquisition import crud
 from app.acquisition.crud import create_acquisition_plan, update_plateread
 from app.acquisition.flows.acquisition_planning import implement_plan
 from app.acquisition.models import (
+    Acquisition,
     AcquisitionCreate,
     AcquisitionPlan,
     AcquisitionPlanCreate,
@@ -34,7 +35,7 @@ from tests.acquisition.utils import (
     create_random_instrument,
     create_random_instrument_type,
 )
-from tests.labware.events import create_random_wellplate
+from tests.labware.utils import create_random_wellplate
 from tests.utils import random_lower_string
 
 
@@ -57,7 +58,6 @@ def test_create_acquisition_already_exists(db: Session) -> None:
     _ = crud.create_acquisition(session=db, acquisition_create=acquisition_create)
     with pytest.raises(IntegrityError):
         crud.create_acquisition(session=db, acquisition_create=acquisition_create)
-    db.rollback()
 
 
 def test_get_acquisition_by_name(db: Session) -> None:
@@ -117,7 +117,6 @@ def test_create_artifact_collection_invalid_acquisition_id(db: Session) -> None:
             artifact_collection_create=artifact_collection_create,
         )
         assert "Acquisition not found" in str(e)
-    db.rollback()
 
 
 def test_create_artifact_duplicate_type_and_location(db: Session) -> None:
@@ -142,7 +141,6 @@ def test_create_artifact_duplicate_type_and_location(db: Session) -> None:
             session=db,
             artifact_collection_create=artifact_collection_create,
         )
-    db.rollback()
 
 
 def test_get_artifact_collection_by_key(db: Session) -> None:
@@ -252,32 +250,28 @@ def test_acquisition_plan_with_not_all_endstate_reads_is_not_completed(
     assert not plan.completed
 
 
-def test_create_acquisition_plan_with_long_name_fails(db: Session) -> None:
-    name = "A" * 256
-    with pytest.raises(ValidationError):
-        create_random_acquisition_plan(session=db, name=name)
-
-
-def test_create_acquisition_plan_with_long_protocol_name_fails(db: Session) -> None:
-    protocol_name = "A" * 256
-    with pytest.raises(ValidationError):
-        create_random_acquisition_plan(session=db, protocol_name=protocol_name)
-
-
-def test_create_acquisition_plan_with_zero_reads_fails(db: Session) -> None:
-    with pytest.raises(ValidationError):
-        create_random_acquisition_plan(session=db, n_reads=0)
-
-
-def test_create_acquisition_plan_with_negative_reads_fails(db: Session) -> None:
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("name", "A" * 256),
+        ("protocol_name", "A" * 256),
+        ("n_reads", 0),
+        ("n_reads", -1),
+    ],
+)
+def test_create_acquisition_plan_with_invalid_field_fails(
+    db: Session, shared_wellplate: Wellplate, field: str, value: object
+) -> None:
     with pytest.raises(ValidationError):
-        create_random_acquisition_plan(session=db, n_reads=-1)
+        create_random_acquisition_plan(
+            session=db, wellplate_id=shared_wellplate.id, **{field: value}
+        )
 
 
-def test_create_acquisition_plan_default_interval_is_zero(db: Session) -> None:
-    acquisition = create_random_acquisition(session=db)
-    wellplate = create_random_wellplate(session=db)
-    wellplate_id = wellplate.id
+def test_create_acquisition_plan_default_interval_is_zero(
+    shared_acquisition: Acquisition, shared_wellplate: Wellplate
+) -> None:
+    wellplate_id = shared_wellplate.id
     storage_location = Location.CQ1
     protocol_name = random_lower_string()
     n_reads = 1
@@ -285,7 +279,7 @@ def test_create_acquisition_plan_default_interval_is_zero(db: Session) -> None:
 
     plan_create = AcquisitionPlanCreate(
         wellplate_id=wellplate_id,
-        acquisition_id=acquisition.id,
+        acquisition_id=shared_acquisition.id,
         storage_location=storage_location,
         protocol_name=protocol_name,
         n_reads=n_reads,
@@ -296,11 +290,10 @@ def test_create_acquisition_plan_default_interval_is_zero(db: Session) -> None:
     assert plan_create.interval == timedelta(days=0)
 
 
-def test_create_acquisition_plan_default_deadline_delta_is_none(db: Session) -> None:
-    acquisition = create_random_acquisition(session=db)
-    wellplate = create_random_wellplate(session=db)
-
-    wellplate_id = wellplate.id
+def test_create_acquisition_plan_default_deadline_delta_is_none(
+    shared_acquisition: Acquisition, shared_wellplate: Wellplate
+) -> None:
+    wellplate_id = shared_wellplate.id
     storage_location = Location.CQ1
     protocol_name = random_lower_string()
     n_reads = 1
@@ -309,7 +302,7 @@ def test_create_acquisition_plan_default_deadline_delta_is_none(db: Session) ->
 
     plan_create = AcquisitionPlanCreate(
         wellplate_id=wellplate_id,
-        acquisition_id=acquisition.id,
+        acquisition_id=shared_acquisition.id,
         storage_location=storage_location,
         protocol_name=protocol_name,
         n_reads=n_reads,
@@ -321,11 +314,10 @@ def test_create_acquisition_plan_default_deadline_delta_is_none(db: Session) ->
     assert plan_create.deadline_delta is None
 
 
-def test_create_acquisition_plan_default_priority_is_normal(db: Session) -> None:
-    acquisition = create_random_acquisition(session=db)
-    wellplate = create_random_wellplate(session=db)
-
-    wellplate_id = wellplate.id
+def test_create_acquisition_plan_default_priority_is_normal(
+    shared_acquisition: Acquisition, shared_wellplate: Wellplate
+) -> None:
+    wellplate_id = shared_wellplate.id
     storage_location = Location.CQ1
     protocol_name = random_lower_string()
     n_reads = 1
@@ -333,7 +325,7 @@ def test_create_acquisition_plan_default_priority_is_normal(db: Session) -> None
 
     plan_create = AcquisitionPlanCreate(
         wellplate_id=wellplate_id,
-        acquisition_id=acquisition.id,
+        acquisition_id=shared_acquisition.id,
         storage_location=storage_location,
         protocol_name=protocol_name,
         n_reads=n_reads,
@@ -365,7 +357,6 @@ def test_create_acquisition_plan_with_invalid_wellplate_id_raises_value_error(
     assert db.get(Wellplate, 2**16) is None  # no such wellplate
     with pytest.raises(IntegrityError):
         create_random_acquisition_plan(session=db, wellplate_id=2**16)
-    db.rollback()
 
 
 def test_delete_wellplate_associated_with_acquisition_plan_cascades_delete(
@@ -391,7 +382,6 @@ def test_create_duplicate_analysis_plan_raises_integrityerror(db: Session) -> No
     _ = crud.create_analysis_plan(session=db, acquisition_id=acquisition.id)
     with pytest.raises(IntegrityError):
         crud.create_analysis_plan(session=db, acquisition_id=acquisition.id)
-    db.rollback()
 
 
 def test_create_analysis_spec(db: Session) -> None:
@@ -460,7 +450,6 @@ def test_create_instrument_type_already_exists(db: Session) -> None:
         crud.create_instrument_type(
             session=db, instrument_type_create=instrument_type_create
         )
-    db.rollback()
 
 
 def test_create_instrument(db: Session) -> None:
@@ -493,4 +482,3 @@ def test_create_duplicate_instrument_raises_integrityerror(db: Session) -> None:
     _ = crud.create_instrument(session=db, instrument_create=instrument_create)
     with pytest.raises(IntegrityError):
         crud.create_instrument(session=db, instrument_create=instrument_create)
-    db.rollback()
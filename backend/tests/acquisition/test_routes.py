@@ -1,17 +1,15 @@
-from unittest.mock import patch
-
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, func, select
 
-from app.acquisition.crud import create_analysis_spec
-from app.acquisition.flows.acquisition_planning import implement_plan
+from app.acquisition import routes
+from app.acquisition.crud import create_acquisition_plan, create_analysis_spec
 from app.acquisition.models import (
     Acquisition,
     AcquisitionCreate,
+    AcquisitionList,
     AcquisitionPlan,
-    AcquisitionPlanCreate,
-    AcquisitionRecord,
     AnalysisPlanCreate,
     AnalysisPlanRecord,
     AnalysisTrigger,
@@ -26,23 +24,31 @@ from app.acquisition.models import (
     SBatchAnalysisSpecCreate,
 )
 from app.core.config import settings
-from app.labware.models import Location
+from app.labware.models import Location, Wellplate
 from tests.acquisition.utils import (
     create_random_acquisition,
     create_random_acquisition_plan,
+    create_random_acquisitions,
     create_random_analysis_plan,
     create_random_instrument,
     create_random_instrument_type,
+    random_acquisition_plan_create,
 )
-from tests.labware.events import create_random_wellplate
-from tests.utils import random_lower_string
+from tests.labware.utils import create_random_wellplate
+from tests.utils import post_json, random_lower_string, record_calls
+
+# Request body shared by the acquisition plan route tests
+ACQUISITION_PLAN_JSON = {"storage_location": Location.CQ1.value, "n_reads": 1}
 
 
-def test_create_instrument_type(pw_authenticated_client: TestClient) -> None:
+def test_create_instrument_type(
+    pw_authenticated_client: TestClient,
+) -> None:
     instrument_type_create = InstrumentTypeCreate(name=random_lower_string())
-    response = pw_authenticated_client.post(
+    response = post_json(
+        pw_authenticated_client,
         f"{settings.API_V1_STR}/instrument_types",
-        json=instrument_type_create.model_dump(mode="json"),
+        instrument_type_create,
     )
     assert response.status_code == status.HTTP_201_CREATED
     assert InstrumentTypeRecord.model_validate(response.json())
@@ -50,23 +56,30 @@ def test_create_instrument_type(pw_authenticated_client: TestClient) -> None:
 
 def test_get_instrument_types(pw_authenticated_client: TestClient) -> None:
     instrument_type_create = InstrumentTypeCreate(name=random_lower_string())
-    pw_authenticated_client.post(
+    response = post_json(
+        pw_authenticated_client,
         f"{settings.API_V1_STR}/instrument_types",
-        json=instrument_type_create.model_dump(mode="json"),
+        instrument_type_create,
     )
-    response = pw_authenticated_client.get(f"{settings.API_V1_STR}/instrument_types")
-    assert response.status_code == status.HTTP_200_OK
-    assert InstrumentTypeList.model_validate(response.json())
-    assert any(
-        item["name"] == instrument_type_create.name for item in response.json()["data"]
+    instrument_type = InstrumentTypeRecord.model_validate(response.json())
+    response = pw_authenticated_client.get(
+        f"{settings.API_V1_STR}/instrument_types",
+        params={"name": instrument_type_create.name},
     )
+    assert response.status_code == status.HTTP_200_OK
+    instrument_types = InstrumentTypeList.model_validate(response.json())
+    assert instrument_types.count == 1
+    assert instrument_types.data[0].id == instrument_type.id
 
 
-def test_delete_instrument_type(pw_authenticated_client: TestClient) -> None:
+def test_delete_instrument_type(
+    pw_authenticated_client: TestClient,
+) -> None:
     instrument_type_create = InstrumentTypeCreate(name=random_lower_string())
-    response = pw_authenticated_client.post(
+    response = post_json(
+        pw_authenticated_client,
         f"{settings.API_V1_STR}/instrument_types",
-        json=instrument_type_create.model_dump(mode="json"),
+        instrument_type_create,
     )
     instrument_type = InstrumentTypeRecord.model_validate(response.json())
     response = pw_authenticated_client.delete(
@@ -75,8 +88,8 @@ def test_delete_instrument_type(pw_authenticated_client: TestClient) -> None:
     assert response.status_code == status.HTTP_204_NO_CONTENT
     response = pw_authenticated_client.get(f"{settings.API_V1_STR}/instrument_types")
     assert response.status_code == status.HTTP_200_OK
-    assert InstrumentTypeList.model_validate(response.json())
-    assert instrument_type.id not in [item["id"] for item in response.json()["data"]]
+    instrument_types = InstrumentTypeList.model_validate_json(response.content)
+    assert instrument_type.id not in [item.id for item in instrument_types.data]
 
 
 def test_create_instrument(pw_authenticated_client: TestClient, db: Session) -> None:
@@ -84,9 +97,10 @@ def test_create_instrument(pw_authenticated_client: TestClient, db: Session) ->
     instrument_create = InstrumentCreate(
         name=random_lower_string(), instrument_type_id=instrument_type.id
     )
-    response = pw_authenticated_client.post(
+    response = post_json(
+        pw_authenticated_client,
         f"{settings.API_V1_STR}/instruments",
-        json=instrument_create.model_dump(mode="json"),
+        instrument_create,
     )
     assert response.status_code == status.HTTP_201_CREATED
     assert InstrumentRecord.model_validate(response.json())
@@ -97,16 +111,19 @@ def test_list_instruments(pw_authenticated_client: TestClient, db: Session) -> N
     instrument_create = InstrumentCreate(
         name=random_lower_string(), instrument_type_id=instrument_type.id
     )
-    pw_authenticated_client.post(
+    response = post_json(
+        pw_authenticated_client,
         f"{settings.API_V1_STR}/instruments",
-        json=instrument_create.model_dump(mode="json"),
+        instrument_create,
     )
-    response = pw_authenticated_client.get(f"{settings.API_V1_STR}/instruments")
-    assert response.status_code == status.HTTP_200_OK
-    assert InstrumentList.model_validate(response.json())
-    assert any(
-        item["name"] == instrument_create.name for item in response.json()["data"]
+    instrument = InstrumentRecord.model_validate(response.json())
+    response = pw_authenticated_client.get(
+        f"{settings.API_V1_STR}/instruments", params={"name": instrument_create.name}
     )
+    assert response.status_code == status.HTTP_200_OK
+    instruments = InstrumentList.model_validate(response.json())
+    assert instruments.count == 1
+    assert instruments.data[0].id == instrument.id
 
 
 def test_delete_instrument_restricted(
@@ -121,21 +138,28 @@ def test_delete_instrument_restricted(
 
 
 def test_get_acquisitions(pw_authenticated_client: TestClient, db: Session) -> None:
-    create_random_acquisition(session=db)
-    response = pw_authenticated_client.get(f"{settings.API_V1_STR}/acquisitions/")
-    assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    assert data["count"] >= 1
-    assert all(
-        AcquisitionRecord.model_validate(acquisition) for acquisition in data["data"]
+    acquisition = create_random_acquisition(session=db)
+    response = pw_authenticated_client.get(
+        f"{settings.API_V1_STR}/acquisitions/", params={"name": acquisition.name}
     )
+    assert response.status_code == status.HTTP_200_OK
+    acquisitions = AcquisitionList.model_validate_json(response.content)
+    assert acquisitions.count == 1
+    assert acquisitions.data[0].id == acquisition.id
 
 
-def test_get_acquisitions_requires_authentication(
-    unauthenticated_client: TestClient,
+def test_get_acquisitions_limit(
+    pw_authenticated_client: TestClient, db: Session
 ) -> None:
-    response = unauthenticated_client.get(f"{settings.API_V1_STR}/acquisitions/")
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    create_random_acquisitions(session=db, n=3)
+    response = pw_authenticated_client.get(
+        f"{settings.API_V1_STR}/acquisitions/", params={"limit": 2}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    acquisitions = AcquisitionList.model_validate_json(response.content)
+    n_acquisitions = db.exec(select(func.count()).select_from(Acquisition)).one()
+    assert acquisitions.count == n_acquisitions
+    assert len(acquisitions.data) == 2
 
 
 def test_create_acquisition(pw_authenticated_client: TestClient, db: Session) -> None:
@@ -143,9 +167,10 @@ def test_create_acquisition(pw_authenticated_client: TestClient, db: Session) ->
     acquisition_create = AcquisitionCreate(
         name=random_lower_string(), instrument_id=instrument.id
     )
-    response = pw_authenticated_client.post(
+    response = post_json(
+        pw_authenticated_client,
         f"{settings.API_V1_STR}/acquisitions/",
-        json=acquisition_create.model_dump(mode="json"),
+        acquisition_create,
     )
     assert response.status_code == status.HTTP_201_CREATED
 
@@ -156,9 +181,10 @@ def test_create_acquisition_invalid_instrument_id(
     acquisition_create = AcquisitionCreate(
         name=random_lower_string(), instrument_id=2**16
     )
-    response = pw_authenticated_client.post(
+    response = post_json(
+        pw_authenticated_client,
         f"{settings.API_V1_STR}/acquisitions/",
-        json=acquisition_create.model_dump(mode="json"),
+        acquisition_create,
     )
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     assert response.json()["detail"] == "No corresponding instrument found."
@@ -167,35 +193,18 @@ def test_create_acquisition_invalid_instrument_id(
 def test_create_duplicate_acquisition_returns_409(
     pw_authenticated_client: TestClient, db: Session
 ) -> None:
-    instrument = create_random_instrument(session=db)
+    acquisition = create_random_acquisition(session=db)
     acquisition_create = AcquisitionCreate(
-        name=random_lower_string(), instrument_id=instrument.id
+        name=acquisition.name, instrument_id=acquisition.instrument_id
     )
-    _ = pw_authenticated_client.post(
+    response = post_json(
+        pw_authenticated_client,
         f"{settings.API_V1_STR}/acquisitions/",
-        json=acquisition_create.model_dump(mode="json"),
-    )
-    response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/acquisitions/",
-        json=acquisition_create.model_dump(mode="json"),
+        acquisition_create,
     )
     assert response.status_code == status.HTTP_409_CONFLICT
 
 
-def test_create_acquisition_requires_authentication(
-    unauthenticated_client: TestClient, db: Session
-) -> None:
-    instrument = create_random_instrument(session=db)
-    acquisition_create = AcquisitionCreate(
-        name=random_lower_string(), instrument_id=instrument.id
-    )
-    response = unauthenticated_client.post(
-        f"{settings.API_V1_STR}/acquisitions/",
-        json=acquisition_create.model_dump(mode="json"),
-    )
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-
 def test_delete_acquisition(pw_authenticated_client: TestClient, db: Session) -> None:
     acquisition = create_random_acquisition(session=db)
     response = pw_authenticated_client.delete(
@@ -204,24 +213,14 @@ def test_delete_acquisition(pw_authenticated_client: TestClient, db: Session) ->
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
     # the acquisition should be deleted from the database
-    db.reset()  # reset to session cache
-    assert db.get(Acquisition, acquisition.id) is None
-
-
-def test_delete_acquisition_not_found(pw_authenticated_client: TestClient) -> None:
-    response = pw_authenticated_client.delete(
-        f"{settings.API_V1_STR}/acquisitions/{2**16}",
-    )
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json()["detail"] == "Acquisition not found."
+    assert db.get(Acquisition, acquisition.id, populate_existing=True) is None
 
 
 def test_create_analysis_plan(pw_authenticated_client: TestClient, db: Session) -> None:
     acquisition = create_random_acquisition(session=db)
     json = AnalysisPlanCreate(acquisition_id=acquisition.id)
-    response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/analysis_plans",
-        json=json.model_dump(mode="json"),
+    response = post_json(
+        pw_authenticated_client, f"{settings.API_V1_STR}/analysis_plans", json
     )
     assert response.status_code == status.HTTP_201_CREATED
 
@@ -229,15 +228,10 @@ def test_create_analysis_plan(pw_authenticated_client: TestClient, db: Session)
 def test_create_analysis_plan_duplicate_returns_409(
     pw_authenticated_client: TestClient, db: Session
 ) -> None:
-    acquisition = create_random_acquisition(session=db)
-    json = AnalysisPlanCreate(acquisition_id=acquisition.id)
-    _ = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/analysis_plans",
-        json=json.model_dump(mode="json"),
-    )
-    response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/analysis_plans",
-        json=json.model_dump(mode="json"),
+    analysis_plan = create_random_analysis_plan(session=db)
+    json = AnalysisPlanCreate(acquisition_id=analysis_plan.acquisition_id)
+    response = post_json(
+        pw_authenticated_client, f"{settings.API_V1_STR}/analysis_plans", json
     )
     assert response.status_code == status.HTTP_409_CONFLICT
     assert response.json()["detail"] == "Acquisition already has an analysis plan."
@@ -246,16 +240,15 @@ def test_create_analysis_plan_duplicate_returns_409(
 def test_get_analysis_plan(pw_authenticated_client: TestClient, db: Session) -> None:
     acquisition = create_random_acquisition(session=db)
     json = AnalysisPlanCreate(acquisition_id=acquisition.id)
-    response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/analysis_plans",
-        json=json.model_dump(mode="json"),
+    response = post_json(
+        pw_authenticated_client, f"{settings.API_V1_STR}/analysis_plans", json
     )
     plan = AnalysisPlanRecord.model_validate(response.json())
     response = pw_authenticated_client.get(
         f"{settings.API_V1_STR}/analysis_plans/{plan.id}"
     )
     assert response.status_code == status.HTTP_200_OK
-    assert AnalysisPlanRecord.model_validate(response.json())
+    assert AnalysisPlanRecord.model_validate_json(response.content).id == plan.id
 
 
 def test_create_analysis_plan_invalid_acquisition_id(
@@ -263,9 +256,8 @@ def test_create_analysis_plan_invalid_acquisition_id(
 ) -> None:
     instrument = create_random_instrument(session=db)
     json = AnalysisPlanCreate(acquisition_id=2**16, instrument_id=instrument.id)
-    response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/analysis_plans",
-        json=json.model_dump(mode="json"),
+    response = post_json(
+        pw_authenticated_client, f"{settings.API_V1_STR}/analysis_plans", json
     )
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     assert response.json()["detail"] == "No corresponding acquisition found."
@@ -287,30 +279,6 @@ def test_delete_analysis_plan_by_id(
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-def test_delete_analysis_plan_by_id_not_found(
-    pw_authenticated_client: TestClient,
-) -> None:
-    response = pw_authenticated_client.delete(
-        f"{settings.API_V1_STR}/analysis_plans/{2**16}",
-    )
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json()["detail"] == "Analysis plan not found."
-
-
-def test_create_analysis_plan_requires_authentication(
-    unauthenticated_client: TestClient, db: Session
-) -> None:
-    acquisition = create_random_acquisition(session=db)
-    json = AnalysisPlanCreate(
-        acquisition_id=acquisition.id, instrument_id=acquisition.instrument.id
-    )
-    response = unauthenticated_client.post(
-        f"{settings.API_V1_STR}/analysis_plans",
-        json=json.model_dump(mode="json"),
-    )
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-
 def test_create_analysis(pw_authenticated_client: TestClient, db: Session) -> None:
     analysis_plan = create_random_analysis_plan(session=db)
     analysis = SBatchAnalysisSpecCreate(
@@ -319,9 +287,8 @@ def test_create_analysis(pw_authenticated_client: TestClient, db: Session) -> No
         analysis_args=[random_lower_string()],
         analysis_plan_id=analysis_plan.id,
     )
-    response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/analyses",
-        json=analysis.model_dump(mode="json"),
+    response = post_json(
+        pw_authenticated_client, f"{settings.API_V1_STR}/analyses", analysis
     )
     assert response.status_code == status.HTTP_201_CREATED
 
@@ -335,30 +302,13 @@ def test_create_analysis_invalid_analysis_plan_id(
         analysis_args=[random_lower_string()],
         analysis_plan_id=2**16,
     )
-    response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/analyses",
-        json=analysis.model_dump(mode="json"),
+    response = post_json(
+        pw_authenticated_client, f"{settings.API_V1_STR}/analyses", analysis
     )
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     assert response.json()["detail"] == "Analysis plan not found."
 
 
-def test_create_analysis_requires_authentication(
-    unauthenticated_client: TestClient,
-) -> None:
-    analysis = SBatchAnalysisSpecCreate(
-        trigger=AnalysisTrigger.END_OF_RUN,
-        analysis_cmd=random_lower_string(),
-        analysis_args=[random_lower_string()],
-        analysis_plan_id=0,
-    )
-    response = unauthenticated_client.post(
-        f"{settings.API_V1_STR}/analyses",
-        json=analysis.model_dump(mode="json"),
-    )
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-
 def test_delete_analysis(pw_authenticated_client: TestClient, db: Session) -> None:
     analysis_plan = create_random_analysis_plan(session=db)
     analysis_create = SBatchAnalysisSpecCreate(
@@ -377,26 +327,7 @@ def test_delete_analysis(pw_authenticated_client: TestClient, db: Session) -> No
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
     # the plan should be deleted from the database
-    db.reset()  # reset to session cache
-    assert db.get(SBatchAnalysisSpec, analysis.id) is None
-
-
-def test_delete_analysis_not_found(pw_authenticated_client: TestClient) -> None:
-    response = pw_authenticated_client.delete(
-        f"{settings.API_V1_STR}/analyses/{2**16}",
-    )
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json()["detail"] == "Analysis specification not found."
-
-
-def test_delete_analysis_requires_authentication(
-    unauthenticated_client: TestClient, db: Session
-) -> None:
-    plan = create_random_analysis_plan(session=db)
-    response = unauthenticated_client.delete(
-        f"{settings.API_V1_STR}/analyses/{plan.id}",
-    )
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert db.get(SBatchAnalysisSpec, analysis.id, populate_existing=True) is None
 
 
 def test_create_acquisition_plan(
@@ -404,13 +335,12 @@ def test_create_acquisition_plan(
 ) -> None:
     wellplate = create_random_wellplate(session=db)
     acquisition = create_random_acquisition(session=db)
-    json = AcquisitionPlanCreate(
-        wellplate_id=wellplate.id,
-        acquisition_id=acquisition.id,
-        storage_location=Location.CQ1,
-        protocol_name=random_lower_string(),
-        n_reads=1,
-    ).model_dump(mode="json")
+    json = {
+        **ACQUISITION_PLAN_JSON,
+        "wellplate_id": wellplate.id,
+        "acquisition_id": acquisition.id,
+        "protocol_name": random_lower_string(),
+    }
     response = pw_authenticated_client.post(
         f"{settings.API_V1_STR}/acquisition_plans",
         json=json,
@@ -426,26 +356,26 @@ def test_create_acquisition_plan(
 def test_create_acquisition_plan_duplicate_returns_400(
     pw_authenticated_client: TestClient, db: Session
 ) -> None:
-    plan_a = create_random_acquisition_plan(session=db)
-    response = pw_authenticated_client.post(
+    plan_create = random_acquisition_plan_create(session=db)
+    create_acquisition_plan(session=db, plan_create=plan_create)
+    response = post_json(
+        pw_authenticated_client,
         f"{settings.API_V1_STR}/acquisition_plans",
-        json=plan_a.model_dump(mode="json"),
+        plan_create,
     )
     assert response.status_code == status.HTTP_409_CONFLICT
     assert response.json()["detail"] == "Acquisition already has an acquisition plan."
 
 
 def test_create_acquisition_plan_invalid_wellplate_id(
-    pw_authenticated_client: TestClient, db: Session
+    pw_authenticated_client: TestClient, shared_acquisition: Acquisition
 ) -> None:
-    acquisition = create_random_acquisition(session=db)
-    json = AcquisitionPlanCreate(
-        wellplate_id=2**16,
-        acquisition_id=acquisition.id,
-        storage_location=Location.CQ1,
-        protocol_name=random_lower_string(),
-        n_reads=1,
-    ).model_dump(mode="json")
+    json = {
+        **ACQUISITION_PLAN_JSON,
+        "wellplate_id": 2**16,
+        "acquisition_id": shared_acquisition.id,
+        "protocol_name": random_lower_string(),
+    }
     response = pw_authenticated_client.post(
         f"{settings.API_V1_STR}/acquisition_plans",
         json=json,
@@ -455,16 +385,14 @@ def test_create_acquisition_plan_invalid_wellplate_id(
 
 
 def test_create_acquisition_plan_invalid_acquisition_id(
-    pw_authenticated_client: TestClient, db: Session
+    pw_authenticated_client: TestClient, shared_wellplate: Wellplate
 ) -> None:
-    wellplate = create_random_wellplate(session=db)
-    json = AcquisitionPlanCreate(
-        wellplate_id=wellplate.id,
-        acquisition_id=2**16,
-        storage_location=Location.CQ1,
-        protocol_name=random_lower_string(),
-        n_reads=1,
-    ).model_dump(mode="json")
+    json = {
+        **ACQUISITION_PLAN_JSON,
+        "wellplate_id": shared_wellplate.id,
+        "acquisition_id": 2**16,
+        "protocol_name": random_lower_string(),
+    }
     response = pw_authenticated_client.post(
         f"{settings.API_V1_STR}/acquisition_plans",
         json=json,
@@ -483,119 +411,117 @@ def test_delete_acquisition_plan_by_id(
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
     # the plan should be deleted from the database
-    db.reset()  # reset to session cache
-    assert db.get(AcquisitionPlan, plan.id) is None
-
-
-def test_delete_acquisition_plan_by_id_not_found(
-    pw_authenticated_client: TestClient,
-) -> None:
-    response = pw_authenticated_client.delete(
-        f"{settings.API_V1_STR}/acquisition_plans/{2**16}",
-    )
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json()["detail"] == "Plan not found"
-
-
-def test_create_acquisition_plan_requires_authentication(
-    unauthenticated_client: TestClient, db: Session
-) -> None:
-    wellplate = create_random_wellplate(session=db)
-    acquisition = create_random_acquisition(session=db)
-    json = AcquisitionPlanCreate(
-        wellplate_id=wellplate.id,
-        acquisition_id=acquisition.id,
-        storage_location=Location.CQ1,
-        protocol_name=random_lower_string(),
-        n_reads=1,
-    ).model_dump(mode="json")
-    response = unauthenticated_client.post(
-        f"{settings.API_V1_STR}/acquisition_plans",
-        json=json,
-    )
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert db.get(AcquisitionPlan, plan.id, populate_existing=True) is None
 
 
 def test_update_plateread_emit_event(
-    pw_authenticated_client: TestClient, db: Session
+    pw_authenticated_client: TestClient,
+    scheduled_plan: AcquisitionPlan,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    plan = create_random_acquisition_plan(session=db)
-    scheduled = implement_plan(session=db, plan=plan)
-    read = scheduled.reads[0]
-    with patch("app.acquisition.routes.handle_plateread_status_update") as mock:
-        response = pw_authenticated_client.patch(
-            f"{settings.API_V1_STR}/platereads/{read.id}",
-            json={"status": "RUNNING"},
-        )
-        assert response.status_code == status.HTTP_200_OK
-        assert response.json()["status"] == "RUNNING"
-        mock.assert_called_once()
-
-
-def test_update_plateread_not_found(pw_authenticated_client: TestClient) -> None:
+    read = scheduled_plan.reads[0]
+    calls = record_calls(monkeypatch, routes, "handle_plateread_status_update")
     response = pw_authenticated_client.patch(
-        f"{settings.API_V1_STR}/platereads/{2**16}",
+        f"{settings.API_V1_STR}/platereads/{read.id}",
         json={"status": "RUNNING"},
     )
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json()["detail"] == "Plate-read not found"
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "RUNNING"
+    assert len(calls) == 1
 
 
 def test_update_plateread_no_change(
-    pw_authenticated_client: TestClient, db: Session
+    pw_authenticated_client: TestClient,
+    scheduled_plan: AcquisitionPlan,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    plan = create_random_acquisition_plan(session=db)
-    scheduled = implement_plan(session=db, plan=plan)
-    read = scheduled.reads[0]
-    with patch("app.acquisition.routes.handle_plateread_status_update") as mock:
-        response = pw_authenticated_client.patch(
-            f"{settings.API_V1_STR}/platereads/{read.id}",
-            json={"status": read.status.value},
-        )
-        assert response.status_code == status.HTTP_200_OK
-        assert response.json()["status"] == read.status.value
-        mock.assert_not_called()
+    read = scheduled_plan.reads[0]
+    calls = record_calls(monkeypatch, routes, "handle_plateread_status_update")
+    response = pw_authenticated_client.patch(
+        f"{settings.API_V1_STR}/platereads/{read.id}",
+        json={"status": read.status.value},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == read.status.value
+    assert calls == []
 
 
 def test_update_plateread_twice_completed(
-    pw_authenticated_client: TestClient, db: Session
-) -> None:
-    plan = create_random_acquisition_plan(session=db)
-    scheduled = implement_plan(session=db, plan=plan)
-    read = scheduled.reads[0]
-    with (
-        patch("app.acquisition.routes.notify_slack") as mock_notif,
-        patch("app.acquisition.routes.handle_plateread_status_update") as _mock,
-    ):
-        pw_authenticated_client.patch(
-            f"{settings.API_V1_STR}/platereads/{read.id}",
-            json={"status": ProcessStatus.COMPLETED.value},
-        )
-        pw_authenticated_client.patch(
-            f"{settings.API_V1_STR}/platereads/{read.id}",
-            json={"status": ProcessStatus.COMPLETED.value},
-        )
-        mock_notif.assert_called_once()
-
-
-def test_update_plateread_requires_authentication(
-    unauthenticated_client: TestClient, db: Session
+    pw_authenticated_client: TestClient,
+    scheduled_plan: AcquisitionPlan,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    plan = create_random_acquisition_plan(session=db)
-    scheduled = implement_plan(session=db, plan=plan)
-    read = scheduled.reads[0]
-    response = unauthenticated_client.patch(
+    read = scheduled_plan.reads[0]
+    notifications = record_calls(monkeypatch, routes, "notify_slack")
+    record_calls(monkeypatch, routes, "handle_plateread_status_update")
+    pw_authenticated_client.patch(
         f"{settings.API_V1_STR}/platereads/{read.id}",
-        json={"status": "RUNNING"},
+        json={"status": ProcessStatus.COMPLETED.value},
+    )
+    pw_authenticated_client.patch(
+        f"{settings.API_V1_STR}/platereads/{read.id}",
+        json={"status": ProcessStatus.COMPLETED.value},
+    )
+    assert len(notifications) == 1
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "json"),
+    [
+        ("GET", "/acquisitions/", None),
+        ("POST", "/acquisitions/", {"name": "unauthorized", "instrument_id": 1}),
+        (
+            "POST",
+            "/analyses",
+            {
+                "trigger": AnalysisTrigger.END_OF_RUN.value,
+                "analysis_cmd": "unauthorized",
+                "analysis_args": [],
+                "analysis_plan_id": 1,
+            },
+        ),
+        ("DELETE", "/analyses/1", None),
+        ("POST", "/analysis_plans", {"acquisition_id": 1}),
+        (
+            "POST",
+            "/acquisition_plans",
+            {
+                **ACQUISITION_PLAN_JSON,
+                "wellplate_id": 1,
+                "acquisition_id": 1,
+                "protocol_name": "unauthorized",
+            },
+        ),
+        ("PATCH", "/platereads/1", {"status": "RUNNING"}),
+        ("DELETE", "/acquisition_plans/1", None),
+    ],
+)
+def test_requires_authentication(
+    unauthenticated_client: TestClient, method: str, path: str, json: dict | None
+) -> None:
+    response = unauthenticated_client.request(
+        method, f"{settings.API_V1_STR}{path}", json=json
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-def test_delete_plan_requires_authentication(
-    unauthenticated_client: TestClient, db: Session
+@pytest.mark.contract
+@pytest.mark.parametrize(
+    ("method", "path", "detail"),
+    [
+        ("DELETE", "/acquisitions", "Acquisition not found."),
+        ("DELETE", "/analysis_plans", "Analysis plan not found."),
+        ("DELETE", "/analyses", "Analysis specification not found."),
+        ("DELETE", "/acquisition_plans", "Plan not found"),
+        ("PATCH", "/platereads", "Plate-read not found"),
+    ],
+)
+def test_not_found(
+    pw_authenticated_client: TestClient, method: str, path: str, detail: str
 ) -> None:
-    plan = create_random_acquisition_plan(session=db)
-    response = unauthenticated_client.delete(
-        f"{settings.API_V1_STR}/acquisition_plans/{plan.id}",
+    json = {"status": "RUNNING"} if method == "PATCH" else None
+    response = pw_authenticated_client.request(
+        method, f"{settings.API_V1_STR}{path}/{2**16}", json=json
     )
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == detail
@@ -1,9 +1,9 @@
-import os
 import random
-import tempfile
 from datetime import timedelta
+from typing import Any
 
-from sqlmodel import Session
+from sqlalchemy import update
+from sqlmodel import Session, col
 
 from app.acquisition.crud import (
     create_acquisition,
@@ -13,6 +13,7 @@ from app.acquisition.crud import (
     create_artifact_collection,
     create_instrument,
     create_instrument_type,
+    get_instrument_by_name,
 )
 from app.acquisition.models import (
     Acquisition,
@@ -29,6 +30,7 @@ from app.acquisition.models import (
     InstrumentCreate,
     InstrumentType,
     InstrumentTypeCreate,
+    PlatereadSpec,
     ProcessStatus,
     Repository,
     SBatchAnalysisSpec,
@@ -36,26 +38,72 @@ from app.acquisition.models import (
     Wellplate,
 )
 from app.labware.models import Location
-from tests.labware.events import create_random_wellplate
-from tests.utils import random_lower_string
+from tests.labware.utils import create_random_wellplate
+from tests.utils import insert_rows, random_lower_string
 
+ANALYSIS_TRIGGERS = tuple(AnalysisTrigger)
+# Name of the instrument acquisitions are created on when no instrument_id is given
+SHARED_INSTRUMENT_NAME = "shared-test-instrument"
 
-def create_random_acquisition(*, session: Session, **kwargs) -> Acquisition:
+
+def get_shared_instrument(*, session: Session) -> Instrument:
+    """
+    Instrument the acquisition factories default to, so they don't insert an
+    instrument type and instrument per acquisition. Looked up by name and
+    inserted if missing; the shared_instrument fixture inserts it once for the
+    session, outside any test savepoint.
+    """
+    instrument = get_instrument_by_name(session=session, name=SHARED_INSTRUMENT_NAME)
+    if instrument is None:
+        instrument_type = create_random_instrument_type(session=session)
+        instrument_create = InstrumentCreate(
+            name=SHARED_INSTRUMENT_NAME, instrument_type_id=instrument_type.id
+        )
+        instrument = create_instrument(
+            session=session, instrument_create=instrument_create
+        )
+    return instrument
+
+
+def create_random_acquisition(
+    *, session: Session, instrument_id: int | None = None, **kwargs
+) -> Acquisition:
     kwargs.setdefault("name", random_lower_string())
-    if "instrument_id" not in kwargs:
-        instrument = create_random_instrument(session=session)
-        kwargs["instrument_id"] = instrument.id
+    if instrument_id is None:
+        instrument_id = get_shared_instrument(session=session).id
     acquisition_create = AcquisitionCreate(
-        name=kwargs["name"], instrument_id=kwargs["instrument_id"]
+        name=kwargs["name"], instrument_id=instrument_id
     )
     return create_acquisition(session=session, acquisition_create=acquisition_create)
 
 
+def create_random_acquisitions(
+    *, session: Session, n: int, instrument_id: int | None = None
+) -> list[Acquisition]:
+    if instrument_id is None:
+        instrument_id = get_shared_instrument(session=session).id
+    return insert_rows(
+        session=session,
+        model=Acquisition,
+        rows=[
+            AcquisitionCreate(
+                name=random_lower_string(), instrument_id=instrument_id
+            ).model_dump()
+            for _ in range(n)
+        ],
+    )
+
+
 def create_random_analysis_plan(
-    *, session: Session, acquisition: Acquisition | None = None
+    *,
+    session: Session,
+    acquisition: Acquisition | None = None,
+    instrument_id: int | None = None,
 ) -> AnalysisPlan:
     if acquisition is None:
-        acquisition = create_random_acquisition(session=session)
+        acquisition = create_random_acquisition(
+            session=session, instrument_id=instrument_id
+        )
     return create_analysis_plan(
         session=session,
         acquisition_id=acquisition.id,  # type: ignore
@@ -68,12 +116,13 @@ def create_random_analysis_spec(
     analysis_trigger: AnalysisTrigger | None = None,
     trigger_value: int | None = None,
     acquisition: Acquisition | None = None,
+    instrument_id: int | None = None,
 ) -> SBatchAnalysisSpec:
     analysis_plan = create_random_analysis_plan(
-        session=session, acquisition=acquisition
+        session=session, acquisition=acquisition, instrument_id=instrument_id
     )
     if analysis_trigger is None:
-        analysis_trigger = random.choice(list(AnalysisTrigger))
+        analysis_trigger = random.choice(ANALYSIS_TRIGGERS)
     analysis_create = SBatchAnalysisSpecCreate(
         trigger=analysis_trigger,
         trigger_value=trigger_value,
@@ -87,46 +136,68 @@ def create_random_analysis_spec(
     )
 
 
-def create_random_acquisition_plan(
+def _acquisition_plan_defaults() -> dict[str, Any]:
+    return {
+        "name": random_lower_string(),
+        "storage_location": Location.CYTOMAT2,
+        "protocol_name": random_lower_string(),
+        "n_reads": 1,
+        "interval": timedelta(minutes=1),
+        "deadline_delta": timedelta(minutes=1),
+        "priority": ImagingPriority.NORMAL,
+    }
+
+
+def random_acquisition_plan_create(
     *,
     session: Session,
     acquisition: Acquisition | None = None,
     wellplate_id: int | None = None,
+    instrument_id: int | None = None,
     **kwargs,
-) -> AcquisitionPlan:
-    kwargs.setdefault("name", random_lower_string())
+) -> AcquisitionPlanCreate:
+    """
+    Build the creation payload used by create_random_acquisition_plan,
+    inserting the acquisition and wellplate it references if not given.
+    """
+    params = _acquisition_plan_defaults() | kwargs
     if acquisition is None:
-        instrument = create_random_instrument(session=session)
-        acquisition_create = AcquisitionCreate(
-            name=kwargs["name"], instrument_id=instrument.id
-        )
-        acquisition = create_acquisition(
-            session=session, acquisition_create=acquisition_create
+        acquisition = create_random_acquisition(
+            session=session, instrument_id=instrument_id, name=params["name"]
         )
 
     if wellplate_id is None:
         wellplate = create_random_wellplate(session=session)
         wellplate_id = int(wellplate.id)
 
-    kwargs.setdefault("wellplate_id", wellplate_id)
-    kwargs.setdefault("storage_location", Location.CYTOMAT2)
-    kwargs.setdefault("protocol_name", random_lower_string())
-    kwargs.setdefault("n_reads", 1)
-    kwargs.setdefault("interval", timedelta(minutes=1))
-    kwargs.setdefault("deadline_delta", timedelta(minutes=1))
-    kwargs.setdefault("priority", ImagingPriority.NORMAL)
-
-    acquisition_plan = AcquisitionPlanCreate(
+    return AcquisitionPlanCreate(
         acquisition_id=acquisition.id,
-        wellplate_id=kwargs["wellplate_id"],
-        storage_location=kwargs["storage_location"],
-        protocol_name=kwargs["protocol_name"],
-        n_reads=kwargs["n_reads"],
-        interval=kwargs["interval"],
-        deadline_delta=kwargs["deadline_delta"],
-        priority=kwargs["priority"],
+        wellplate_id=wellplate_id,
+        storage_location=params["storage_location"],
+        protocol_name=params["protocol_name"],
+        n_reads=params["n_reads"],
+        interval=params["interval"],
+        deadline_delta=params["deadline_delta"],
+        priority=params["priority"],
     )
-    return create_acquisition_plan(session=session, plan_create=acquisition_plan)
+
+
+def create_random_acquisition_plan(
+    *,
+    session: Session,
+    acquisition: Acquisition | None = None,
+    wellplate_id: int | None = None,
+    instrument_id: int | None = None,
+    **kwargs,
+) -> AcquisitionPlan:
+    plan_create = random_acquisition_plan_create(
+        session=session,
+        acquisition=acquisition,
+        wellplate_id=wellplate_id,
+        instrument_id=instrument_id,
+        **kwargs,
+    )
+    return create_acquisition_plan(session=session, plan_create=plan_create)
 
 
 def create_random_artifact_collection(
@@ -135,9 +206,12 @@ def create_random_artifact_collection(
     artifact_type: ArtifactType = ArtifactType.ACQUISITION_DATA,
     location: Repository = Repository.ACQUISITION_STORE,
     acquisition: Acquisition | None = None,
+    instrument_id: int | None = None,
 ) -> ArtifactCollection:
     if acquisition is None:
-        acquisition = create_random_acquisition(session=session)
+        acquisition = create_random_acquisition(
+            session=session, instrument_id=instrument_id
+        )
 
     artifact_collection_create = ArtifactCollectionCreate(
         acquisition_id=acquisition.id, artifact_type=artifact_type, location=location
@@ -147,8 +221,7 @@ def create_random_artifact_collection(
         artifact_collection_create=artifact_collection_create,
     )
     collection.path.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile(dir=collection.path, delete=False) as f:
-        f.write(os.urandom(1024))
+    (collection.path / f"f{collection.id}").write_bytes(b"\0")
     return collection
 
 
@@ -165,13 +238,16 @@ def move_plate_to_acquisition_plan_location(
 def complete_reads(
     acquisition_plan: AcquisitionPlan, session: Session, n_reads: int | None = None
 ):
+    statement = update(PlatereadSpec).values(status=ProcessStatus.COMPLETED)
     if n_reads is None:
-        n_reads = len(acquisition_plan.reads)
-    for read in acquisition_plan.reads[:n_reads]:
-        read.status = ProcessStatus.COMPLETED
-        session.add(read)
+        statement = statement.where(
+            PlatereadSpec.acquisition_plan_id == acquisition_plan.id
+        )
+    else:
+        read_ids = [read.id for read in acquisition_plan.reads[:n_reads]]
+        statement = statement.where(col(PlatereadSpec.id).in_(read_ids))
+    session.execute(statement)
     session.commit()
-    session.refresh(acquisition_plan)
     create_random_artifact_collection(
         session=session,
         artifact_type=ArtifactType.ACQUISITION_DATA,
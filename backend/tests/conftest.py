@@ -1,24 +1,149 @@
 import contextlib
 import os
 from collections.abc import Generator
+from datetime import timedelta
 
 import filelock
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from prefect.testing.utilities import prefect_test_harness
+from sqlalchemy import Connection, Engine, event
+from sqlalchemy.pool import NullPool
+from sqlmodel import Session, create_engine
 
+from app.core import security
 from app.core.config import settings
-from app.core.db import engine, init_db
+from app.core.db import engine as default_engine
+from app.core.db import init_db
 from app.main import app
+from app.users.crud import get_user_by_email
 from tests.users.utils import authentication_token_from_email
-from tests.utils import get_superuser_api_key_headers, get_superuser_token_headers
+from tests.utils import get_superuser_api_key_headers
 
 
 @pytest.fixture(scope="session", autouse=True)
-def db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
-        init_db(session)
+def fast_secret_hashing() -> Generator[None, None, None]:
+    """
+    Hash passwords and API keys with the minimum bcrypt cost. Hashes made
+    with the default cost (e.g. by prestart.sh) still verify.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "BCRYPT_ROUNDS", 4)
+        mp.setattr(
+            security,
+            "pwd_context",
+            security.pwd_context.copy(bcrypt__rounds=settings.BCRYPT_ROUNDS),
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def engine(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Engine, None, None]:
+    """
+    Engine for the test database.
+
+    Under pytest-xdist each worker clones the migrated database with
+    ``CREATE DATABASE ... TEMPLATE`` and runs against its own copy, so
+    migrations still happen only once (in prestart.sh).
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is None:
+        yield default_engine
+        return
+
+    template = default_engine.url.database
+    database = f"{template}_{worker}"
+    # Not pooled, so no idle connection to the maintenance database outlives
+    # the CREATE/DROP statements
+    admin_engine = create_engine(
+        default_engine.url.set(database="postgres"),
+        isolation_level="AUTOCOMMIT",
+        poolclass=NullPool,
+    )
+    # Postgres refuses to clone a template that another session is cloning
+    lock_file = tmp_path_factory.getbasetemp().parent / "template.lock"
+    with filelock.FileLock(str(lock_file)), admin_engine.connect() as conn:
+        conn.exec_driver_sql(f'DROP DATABASE IF EXISTS "{database}"')
+        conn.exec_driver_sql(f'CREATE DATABASE "{database}" TEMPLATE "{template}"')
+
+    worker_engine = create_engine(
+        default_engine.url.set(database=database), poolclass=NullPool
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.core.deps.engine", worker_engine)
+        yield worker_engine
+    worker_engine.dispose()
+
+    with admin_engine.connect() as conn:
+        conn.exec_driver_sql(f'DROP DATABASE IF EXISTS "{database}"')
+    admin_engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def connection(engine: Engine) -> Generator[Connection, None, None]:
+    """
+    Connection shared by the test session and the app, inside one outer
+    transaction that is rolled back once all tests have run.
+
+    The superuser is seeded (and committed) first, so logins made on other
+    connections can see it.
+    """
+    with engine.connect() as connection:
+        with Session(bind=connection) as session:
+            init_db(session)
+        transaction = connection.begin()
+        yield connection
+        transaction.rollback()
+
+
+@pytest.fixture(scope="module")
+def db_module(connection: Connection) -> Generator[Session, None, None]:
+    """
+    Session for module-scoped fixtures, rolled back at the end of the module.
+    """
+    savepoint = connection.begin_nested()
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+        yield session
+    savepoint.rollback()
+
+
+@pytest.fixture(autouse=True)
+def db(
+    connection: Connection, monkeypatch: pytest.MonkeyPatch
+) -> Generator[Session, None, None]:
+    """
+    Run each test inside a SAVEPOINT that is rolled back on teardown.
+
+    Sessions opened by the app and by flows through ``app.core.deps`` are bound
+    to the same connection. Because the connection is already inside a
+    SAVEPOINT, their commits only release nested SAVEPOINTs and never escape
+    the test. A test that ends on a failed flush needs no rollback of its
+    own; closing the session discards it.
+    """
+    savepoint = connection.begin_nested()
+    monkeypatch.setattr("app.core.deps.engine", connection)
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
         yield session
+    savepoint.rollback()
+
+
+@pytest.fixture
+def sql_statements(connection: Connection) -> Generator[list[str], None, None]:
+    """
+    SQL executed on the shared connection during the test, by the test's
+    session and by the app alike. Used to check that list endpoints don't
+    lazy-load per row.
+    """
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, _parameters, _context, _executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", record)
+    yield statements
+    event.remove(connection, "before_cursor_execute", record)
 
 
 @pytest.fixture(scope="session")
@@ -28,46 +153,94 @@ def client() -> Generator[TestClient, None, None]:
 
 
 @pytest.fixture(scope="session")
-def superuser_token_headers(client: TestClient) -> dict[str, str]:
-    return get_superuser_token_headers(client)
+def superuser_token_headers(engine: Engine) -> dict[str, str]:
+    """
+    Superuser bearer token, minted in-process the way the login route issues
+    it. Logging in itself is covered by the users route tests.
+    """
+    with Session(engine) as session:
+        superuser = get_user_by_email(session=session, email=settings.FIRST_SUPERUSER)
+    assert superuser is not None
+    token = security.create_access_token(
+        superuser.id,
+        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+    return {"Authorization": f"Bearer {token}"}
 
 
 @pytest.fixture(scope="session")
-def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]:
-    return authentication_token_from_email(
-        client=client, email=settings.EMAIL_TEST_USER, db=db
-    )
+def normal_user_token_headers(client: TestClient, engine: Engine) -> dict[str, str]:
+    with Session(engine) as session:
+        return authentication_token_from_email(
+            client=client, email=settings.EMAIL_TEST_USER, db=session
+        )
 
 
 @pytest.fixture(scope="session")
-def superuser_api_key_headers(client: TestClient):
-    return get_superuser_api_key_headers(client)
+def superuser_api_key_headers(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> dict[str, str]:
+    return get_superuser_api_key_headers(client, superuser_token_headers)
 
 
 @pytest.fixture(scope="session")
-def unauthenticated_client() -> Generator[TestClient, None, None]:
-    with TestClient(app) as c:
-        yield c
+def unauthenticated_client(client: TestClient) -> TestClient:
+    return client
 
 
-@pytest.fixture(scope="session")
+@contextlib.contextmanager
+def _client_headers(
+    client: TestClient, headers: dict[str, str]
+) -> Generator[TestClient, None, None]:
+    """
+    Set headers on the shared client, restoring whatever they replaced on exit.
+    """
+    previous = {name: client.headers.get(name) for name in headers}
+    client.headers.update(headers)
+    try:
+        yield client
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                client.headers.pop(name, None)
+            else:
+                client.headers[name] = value
+
+
+@pytest.fixture
 def pw_authenticated_client(
-    normal_user_token_headers: dict[str, str],
+    client: TestClient, normal_user_token_headers: dict[str, str]
 ) -> Generator[TestClient, None, None]:
-    with TestClient(app) as c:
-        c.headers.update(normal_user_token_headers)
+    """
+    The session client, carrying the normal user's cached bearer token for
+    the duration of one test.
+    """
+    with _client_headers(client, normal_user_token_headers) as c:
         yield c
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def key_authenticated_client(
-    superuser_api_key_headers: dict[str, str],
+    client: TestClient, superuser_api_key_headers: dict[str, str]
 ) -> Generator[TestClient, None, None]:
-    with TestClient(app) as c:
-        c.headers.update(superuser_api_key_headers)
+    """
+    The session client, carrying the superuser's API key for the duration of
+    one test.
+    """
+    with _client_headers(client, superuser_api_key_headers) as c:
         yield c
 
 
+@pytest.fixture(scope="session", autouse=True)
+def prefect_test_fixture() -> Generator[None, None, None]:
+    """
+    Prefect test harness (temporary API server and database), started once
+    for the run.
+    """
+    with prefect_test_harness():
+        yield
+
+
 @pytest.fixture(scope="session")
 def serial_lock(tmp_path_factory):
     base_temp = tmp_path_factory.getbasetemp()
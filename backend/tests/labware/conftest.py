@@ -1,8 +1,14 @@
 import pytest
-from prefect.testing.utilities import prefect_test_harness
+from sqlmodel import Session
 
+from app.labware.models import Wellplate
+from tests.labware.utils import create_random_wellplate
 
-@pytest.fixture(autouse=True, scope="module")
-def prefect_test_fixture():
-    with prefect_test_harness():
-        yield
+
+@pytest.fixture
+def wellplate(db: Session) -> Wellplate:
+    """
+    A fresh wellplate, rolled back with the test. Function-scoped because
+    the route tests that use it move it between locations.
+    """
+    return create_random_wellplate(session=db)
@@ -10,14 +10,13 @@ from app.labware.models import (
     WellplateType,
     WellplateUpdate,
 )
+from tests.labware.utils import WELLPLATE_CREATE
 from tests.utils import random_lower_string
 
 
 def test_create_wellplate(db: Session) -> None:
     name = random_lower_string(9)
-    well_plate_in = WellplateCreate(
-        name=name, plate_type=WellplateType.REVVITY_PHENOPLATE_96
-    )
+    well_plate_in = WELLPLATE_CREATE.model_copy(update={"name": name})
     well_plate = crud.create_wellplate(session=db, wellplate_create=well_plate_in)
     assert well_plate.name == well_plate_in.name
     assert well_plate.plate_type == well_plate_in.plate_type
@@ -37,9 +36,7 @@ def test_create_wellplate_long_name():
 
 def test_update_wellplate(db: Session) -> None:
     name = random_lower_string(9)
-    well_plate_in = WellplateCreate(
-        name=name, plate_type=WellplateType.REVVITY_PHENOPLATE_96
-    )
+    well_plate_in = WELLPLATE_CREATE.model_copy(update={"name": name})
     wellplate = crud.create_wellplate(session=db, wellplate_create=well_plate_in)
     orig_loc = wellplate.location
 
@@ -54,9 +51,7 @@ def test_update_wellplate(db: Session) -> None:
 
 def test_get_wellplate_by_name(db: Session) -> None:
     name = random_lower_string(9)
-    well_plate_in = WellplateCreate(
-        name=name, plate_type=WellplateType.REVVITY_PHENOPLATE_96
-    )
+    well_plate_in = WELLPLATE_CREATE.model_copy(update={"name": name})
     well_plate = crud.create_wellplate(session=db, wellplate_create=well_plate_in)
 
     other_well_plate = crud.get_wellplate_by_name(session=db, name=name)
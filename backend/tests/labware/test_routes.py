@@ -1,48 +1,68 @@
-from unittest.mock import patch
+from unittest.mock import call
 
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from app.core.config import settings
-from app.labware import crud
-from app.labware.models import Location, WellplateCreate, WellplateRecord, WellplateType
-from tests.labware.events import create_random_wellplate
-from tests.utils import random_lower_string
+from app.labware import crud, events
+from app.labware.models import (
+    Location,
+    Wellplate,
+    WellplateList,
+)
+from tests.labware.utils import WELLPLATE_CREATE, create_random_wellplates
+from tests.utils import random_lower_string, record_calls
+
+LABWARE_URL = f"{settings.API_V1_STR}/labware/"
+
+# Plate type used by the tests that don't depend on it
+PHENO96 = WELLPLATE_CREATE.plate_type
+PHENO96_VALUE = PHENO96.value
 
 
 def test_retrieve_wellplates(pw_authenticated_client: TestClient, db: Session) -> None:
-    # create a wellplate
-    name = random_lower_string(9)
-    plate_type = WellplateType.REVVITY_PHENOPLATE_96
-    wellplate_in = WellplateCreate(name=name, plate_type=plate_type)
-    crud.create_wellplate(session=db, wellplate_create=wellplate_in)
+    create_random_wellplates(session=db, n=2)
 
-    response = pw_authenticated_client.get(f"{settings.API_V1_STR}/labware/")
+    response = pw_authenticated_client.get(LABWARE_URL)
     assert response.status_code == status.HTTP_200_OK
-    all_wellplates = response.json()
+    all_wellplates = WellplateList.model_validate_json(response.content)
+    assert all_wellplates.count >= 2
 
-    assert all_wellplates["count"] >= 1
-    for item in all_wellplates["data"]:
-        WellplateRecord.model_validate(item)
+
+def test_list_wellplates_query_count_is_constant(
+    pw_authenticated_client: TestClient, db: Session, sql_statements: list[str]
+) -> None:
+    create_random_wellplates(session=db, n=3)
+
+    sql_statements.clear()
+    response = pw_authenticated_client.get(LABWARE_URL, params={"limit": 1})
+    assert response.status_code == status.HTTP_200_OK
+    n_single = len(sql_statements)
+
+    sql_statements.clear()
+    response = pw_authenticated_client.get(LABWARE_URL, params={"limit": 3})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["data"]) == 3
+    assert len(sql_statements) == n_single
 
 
 def test_get_wellplate_by_name_not_found(pw_authenticated_client: TestClient) -> None:
     name = random_lower_string(9)
-    response = pw_authenticated_client.get(
-        f"{settings.API_V1_STR}/labware", params={"name": name}
-    )
+    response = pw_authenticated_client.get(LABWARE_URL, params={"name": name})
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["count"] == 0
-    assert response.json()["data"] == []
+    body = response.json()
+    assert body["count"] == 0
+    assert body["data"] == []
 
 
 def test_create_wellplate(pw_authenticated_client: TestClient, db: Session) -> None:
     name = random_lower_string(9)
-    plate_type = WellplateType.REVVITY_PHENOPLATE_96.value
+    plate_type = PHENO96_VALUE
 
     response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/labware/",
+        LABWARE_URL,
         json={"name": name, "plate_type": plate_type},
     )
     assert response.status_code == status.HTTP_201_CREATED
@@ -55,14 +75,14 @@ def test_create_wellplate(pw_authenticated_client: TestClient, db: Session) -> N
     wellplate = crud.get_wellplate_by_name(session=db, name=name)
     assert wellplate is not None
     assert wellplate.name == name
-    assert wellplate.plate_type == WellplateType.REVVITY_PHENOPLATE_96
+    assert wellplate.plate_type == PHENO96
 
 
 def test_create_wellplate_empty_name(pw_authenticated_client: TestClient) -> None:
     name = ""
     response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/labware/",
-        json={"name": name, "plate_type": WellplateType.REVVITY_PHENOPLATE_96.value},
+        LABWARE_URL,
+        json={"name": name, "plate_type": PHENO96_VALUE},
     )
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
@@ -70,8 +90,8 @@ def test_create_wellplate_empty_name(pw_authenticated_client: TestClient) -> Non
 def test_create_wellplate_long_name(pw_authenticated_client: TestClient) -> None:
     name = random_lower_string(10)
     response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/labware/",
-        json={"name": name, "plate_type": WellplateType.REVVITY_PHENOPLATE_96.value},
+        LABWARE_URL,
+        json={"name": name, "plate_type": PHENO96_VALUE},
     )
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
@@ -80,13 +100,12 @@ def test_create_wellplate_duplicate_fails(
     pw_authenticated_client: TestClient, db: Session
 ) -> None:
     name = random_lower_string(9)
-    plate_type = WellplateType.REVVITY_PHENOPLATE_96
-    wellplate_in = WellplateCreate(name=name, plate_type=plate_type)
+    wellplate_in = WELLPLATE_CREATE.model_copy(update={"name": name})
     crud.create_wellplate(session=db, wellplate_create=wellplate_in)
 
     response = pw_authenticated_client.post(
-        f"{settings.API_V1_STR}/labware/",
-        json={"name": name, "plate_type": plate_type.value},
+        LABWARE_URL,
+        json={"name": name, "plate_type": PHENO96_VALUE},
     )
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json() == {"detail": "A wellplate with this name already exists."}
@@ -94,13 +113,12 @@ def test_create_wellplate_duplicate_fails(
 
 def test_update_wellplate(pw_authenticated_client: TestClient, db: Session) -> None:
     name = random_lower_string(9)
-    plate_type = WellplateType.REVVITY_PHENOPLATE_96
-    wellplate_in = WellplateCreate(name=name, plate_type=plate_type)
+    wellplate_in = WELLPLATE_CREATE.model_copy(update={"name": name})
     wellplate = crud.create_wellplate(session=db, wellplate_create=wellplate_in)
 
     location = Location.CQ1
     response = pw_authenticated_client.patch(
-        f"{settings.API_V1_STR}/labware/{wellplate.id}",
+        f"{LABWARE_URL}{wellplate.id}",
         json={"location": location.value},
     )
     assert response.status_code == status.HTTP_200_OK
@@ -108,14 +126,16 @@ def test_update_wellplate(pw_authenticated_client: TestClient, db: Session) -> N
 
     assert data["location"] == location.value
 
-    db.refresh(wellplate)
-    assert wellplate.location == location
+    stored_location = db.exec(
+        select(Wellplate.location).where(Wellplate.id == wellplate.id)
+    ).one()
+    assert stored_location == location
 
 
 def test_update_wellplate_not_found(pw_authenticated_client: TestClient) -> None:
     location = Location.CQ1
     response = pw_authenticated_client.patch(
-        f"{settings.API_V1_STR}/labware/{2**16}",
+        f"{LABWARE_URL}{2**16}",
         json={"location": location.value},
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -123,37 +143,35 @@ def test_update_wellplate_not_found(pw_authenticated_client: TestClient) -> None
 
 
 def test_update_wellplate_emit_event(
-    pw_authenticated_client: TestClient, db: Session
+    pw_authenticated_client: TestClient,
+    wellplate: Wellplate,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    wellplate_in = create_random_wellplate(session=db)
-    with patch(
-        "app.labware.events.check_to_schedule_acquisition_plan"
-    ) as mock_emit_event:
-        pw_authenticated_client.patch(
-            f"{settings.API_V1_STR}/labware/{wellplate_in.id}",
-            json={"location": Location.CYTOMAT2.value},
-        )
-        mock_emit_event.assert_called_once_with(wellplate_id=wellplate_in.id)
+    calls = record_calls(monkeypatch, events, "check_to_schedule_acquisition_plan")
+    pw_authenticated_client.patch(
+        f"{LABWARE_URL}{wellplate.id}",
+        json={"location": Location.CYTOMAT2.value},
+    )
+    assert calls == [call(wellplate_id=wellplate.id)]
 
 
 def test_update_wellplate_no_change_doesnt_emit_event(
-    pw_authenticated_client: TestClient, db: Session
+    pw_authenticated_client: TestClient,
+    wellplate: Wellplate,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    wellplate_in = create_random_wellplate(session=db)
-    with patch(
-        "app.labware.events.check_to_schedule_acquisition_plan"
-    ) as mock_emit_event:
-        pw_authenticated_client.patch(
-            f"{settings.API_V1_STR}/labware/{wellplate_in.id}",
-            json={"location": Location.EXTERNAL.value},
-        )
-        mock_emit_event.assert_not_called()
+    calls = record_calls(monkeypatch, events, "check_to_schedule_acquisition_plan")
+    pw_authenticated_client.patch(
+        f"{LABWARE_URL}{wellplate.id}",
+        json={"location": Location.EXTERNAL.value},
+    )
+    assert calls == []
 
 
 def test_list_wellplates_unauthenticated_fails(
     unauthenticated_client: TestClient,
 ) -> None:
-    response = unauthenticated_client.get(f"{settings.API_V1_STR}/labware/")
+    response = unauthenticated_client.get(LABWARE_URL)
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json() == {"detail": "Not authenticated"}
 
@@ -162,10 +180,10 @@ def test_create_wellplate_unauthenticated_fails(
     unauthenticated_client: TestClient,
 ) -> None:
     name = random_lower_string(9)
-    plate_type = WellplateType.REVVITY_PHENOPLATE_96.value
+    plate_type = PHENO96_VALUE
 
     response = unauthenticated_client.post(
-        f"{settings.API_V1_STR}/labware/",
+        LABWARE_URL,
         json={"name": name, "plate_type": plate_type},
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -176,7 +194,7 @@ def test_update_wellplate_authenticated_fails(
     unauthenticated_client: TestClient,
 ) -> None:
     response = unauthenticated_client.patch(
-        f"{settings.API_V1_STR}/labware/1",
+        f"{LABWARE_URL}1",
         json={"location": Location.CQ1.value},
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -187,7 +205,7 @@ def test_print_barcode_unauthenticated_fails(
     unauthenticated_client: TestClient,
 ) -> None:
     response = unauthenticated_client.post(
-        f"{settings.API_V1_STR}/labware/1/barcode",
+        f"{LABWARE_URL}1/barcode",
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert response.json() == {"detail": "Not authenticated"}
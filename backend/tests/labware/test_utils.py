@@ -1,37 +1,29 @@
-from unittest.mock import patch
+from unittest.mock import call
 
-from sqlmodel import Session
+import pytest
 
-from app.labware.crud import update_wellplate
+from app.labware import events
 from app.labware.events import handle_wellplate_location_update
-from app.labware.models import Location, WellplateUpdate
-from tests.labware.events import create_random_wellplate
+from app.labware.models import Location
+from tests.utils import record_calls
 
+# handle_wellplate_location_update only passes the id on, so it needn't exist
+WELLPLATE_ID = 1
 
-def test_handle_wellplate_location_update(db: Session) -> None:
-    wellplate = create_random_wellplate(session=db)
-    before = wellplate.location
-    assert before == Location.EXTERNAL
-    wellplate_in = WellplateUpdate(location=Location.CYTOMAT2)
-    update_wellplate(session=db, db_wellplate=wellplate, wellplate_in=wellplate_in)
 
-    with patch(
-        "app.labware.events.check_to_schedule_acquisition_plan"
-    ) as mock_emit_event:
-        handle_wellplate_location_update(
-            wellplate_id=wellplate.id, origin=before, dest=Location.CYTOMAT2
-        )
-        mock_emit_event.assert_called_once_with(wellplate_id=wellplate.id)
+def test_handle_wellplate_location_update(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = record_calls(monkeypatch, events, "check_to_schedule_acquisition_plan")
+    handle_wellplate_location_update(
+        wellplate_id=WELLPLATE_ID, origin=Location.EXTERNAL, dest=Location.CYTOMAT2
+    )
+    assert calls == [call(wellplate_id=WELLPLATE_ID)]
 
 
-def test_handle_wellplate_location_update_no_difference(db: Session) -> None:
-    wellplate = create_random_wellplate(session=db)
-    assert wellplate.location == Location.EXTERNAL
-
-    with patch(
-        "app.labware.events.check_to_schedule_acquisition_plan"
-    ) as mock_emit_event:
-        handle_wellplate_location_update(
-            wellplate_id=wellplate.id, origin=Location.EXTERNAL, dest=Location.EXTERNAL
-        )
-        mock_emit_event.assert_not_called()
+def test_handle_wellplate_location_update_no_difference(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = record_calls(monkeypatch, events, "check_to_schedule_acquisition_plan")
+    handle_wellplate_location_update(
+        wellplate_id=WELLPLATE_ID, origin=Location.EXTERNAL, dest=Location.EXTERNAL
+    )
+    assert calls == []
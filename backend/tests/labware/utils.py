@@ -0,0 +1,46 @@
+import random
+
+from sqlmodel import Session
+
+from app.labware.crud import create_wellplate
+from app.labware.models import Location, Wellplate, WellplateCreate, WellplateType
+from tests.utils import insert_rows, random_lower_string
+
+WELLPLATE_TYPES = tuple(WellplateType)
+# Validated once; tests copy it with a random name, which skips validation
+WELLPLATE_CREATE = WellplateCreate(
+    name="template", plate_type=WellplateType.REVVITY_PHENOPLATE_96
+)
+
+
+def create_random_wellplate(*, session: Session, **kwargs):
+    kwargs.setdefault("name", random_lower_string(9))
+    kwargs.setdefault("plate_type", random.choice(WELLPLATE_TYPES))
+    wellplate_create = WellplateCreate(**kwargs)
+    wellplate = create_wellplate(session=session, wellplate_create=wellplate_create)
+    return wellplate
+
+
+def create_random_wellplates(*, session: Session, n: int) -> list[Wellplate]:
+    return insert_rows(
+        session=session,
+        model=Wellplate,
+        rows=[
+            Wellplate.model_validate(
+                WellplateCreate(
+                    name=random_lower_string(9),
+                    plate_type=random.choice(WELLPLATE_TYPES),
+                )
+            ).model_dump(exclude={"id"})
+            for _ in range(n)
+        ],
+    )
+
+
+def set_wellplate_location(
+    *, session: Session, wellplate: Wellplate, location: Location
+) -> Wellplate:
+    wellplate.location = location
+    session.add(wellplate)
+    session.commit()
+    return wellplate
@@ -1,5 +1,4 @@
 import pytest
-from fastapi.encoders import jsonable_encoder
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session
 
@@ -29,7 +28,6 @@ def test_create_user_already_exists(db: Session) -> None:
     user_in = UserCreate(email=user.email, password=random_lower_string())
     with pytest.raises(IntegrityError):
         crud.create_user(session=db, user_create=user_in)
-    db.rollback()
 
 
 def test_authenticate_user(db: Session) -> None:
@@ -49,36 +47,21 @@ def test_not_authenticate_user(db: Session) -> None:
     assert user is None
 
 
-def test_check_if_user_is_active(db: Session) -> None:
-    email = random_email()
-    password = random_lower_string()
-    user_in = UserCreate(email=email, password=password)
-    user = crud.create_user(session=db, user_create=user_in)
-    assert user.is_active is True
-
-
-def test_check_if_user_is_active_inactive(db: Session) -> None:
-    email = random_email()
-    password = random_lower_string()
-    user_in = UserCreate(email=email, password=password, is_active=False)
-    user = crud.create_user(session=db, user_create=user_in)
-    assert user.is_active is False
-
-
-def test_check_if_user_is_superuser(db: Session) -> None:
-    email = random_email()
-    password = random_lower_string()
-    user_in = UserCreate(email=email, password=password, is_superuser=True)
-    user = crud.create_user(session=db, user_create=user_in)
-    assert user.is_superuser is True
-
-
-def test_check_if_user_is_superuser_normal_user(db: Session) -> None:
-    username = random_email()
-    password = random_lower_string()
-    user_in = UserCreate(email=username, password=password)
+@pytest.mark.parametrize(
+    ("kwargs", "flag", "value"),
+    [
+        ({}, "is_active", True),
+        ({"is_active": False}, "is_active", False),
+        ({"is_superuser": True}, "is_superuser", True),
+        ({}, "is_superuser", False),
+    ],
+)
+def test_check_user_flags(
+    db: Session, kwargs: dict[str, bool], flag: str, value: bool
+) -> None:
+    user_in = UserCreate(email=random_email(), password=random_lower_string(), **kwargs)
     user = crud.create_user(session=db, user_create=user_in)
-    assert user.is_superuser is False
+    assert getattr(user, flag) is value
 
 
 def test_get_user(db: Session) -> None:
@@ -89,7 +72,7 @@ def test_get_user(db: Session) -> None:
     user_2 = db.get(User, user.id)
     assert user_2
     assert user.email == user_2.email
-    assert jsonable_encoder(user) == jsonable_encoder(user_2)
+    assert user.model_dump() == user_2.model_dump()
 
 
 def test_update_user(db: Session) -> None:
@@ -97,10 +80,10 @@ def test_update_user(db: Session) -> None:
     email = random_email()
     user_in = UserCreate(email=email, password=password, is_superuser=True)
     user = crud.create_user(session=db, user_create=user_in)
+    assert user.id is not None
     new_password = random_lower_string()
     user_in_update = UserUpdate(password=new_password, is_superuser=True)
-    if user.id is not None:
-        crud.update_user(session=db, db_user=user, user_in=user_in_update)
+    crud.update_user(session=db, db_user=user, user_in=user_in_update)
     user_2 = db.get(User, user.id)
     assert user_2
     assert user.email == user_2.email
@@ -127,7 +110,7 @@ def test_delete_application(db: Session) -> None:
     app = db.get(Application, app_key.id)
     assert app is not None
     db.delete(app)
-    db.commit()
+    db.flush()
     assert db.get(Application, app.id) is None
 
 
@@ -140,6 +123,6 @@ def test_delete_user_app_cascade(db: Session) -> None:
     app = db.get(Application, app_key.id)
     assert app is not None
     db.delete(user)
-    db.commit()
+    db.flush()
     assert db.get(User, user.id) is None
     assert db.get(Application, app.id) is None
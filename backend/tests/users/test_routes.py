@@ -8,7 +8,7 @@ from app.core.config import settings
 from app.core.security import verify_secret
 from app.users import crud
 from app.users.models import Application, User, UserCreate
-from tests.utils import random_email, random_lower_string
+from tests.utils import create_random_users, random_email, random_lower_string
 
 
 def test_get_users_superuser_me(
@@ -149,15 +149,7 @@ def test_create_user_by_normal_user(
 def test_retrieve_users(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
-    username = random_email()
-    password = random_lower_string()
-    user_in = UserCreate(email=username, password=password)
-    crud.create_user(session=db, user_create=user_in)
-
-    username2 = random_email()
-    password2 = random_lower_string()
-    user_in2 = UserCreate(email=username2, password=password2)
-    crud.create_user(session=db, user_create=user_in2)
+    create_random_users(session=db, n=2)
 
     r = client.get(f"{settings.API_V1_STR}/users/", headers=superuser_token_headers)
     all_users = r.json()